@@ -1,9 +1,12 @@
 import customtkinter as ctk
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from collections import deque
+import math
+import multiprocessing
 import random
 import tkinter.messagebox as mb
+from scheduler_engine import (BURST_DISTRIBUTIONS, MC_MAX_SAMPLES, run_round_robin, generate_workloads,
+                              create_executor, submit_monte_carlo, summarize_monte_carlo)
 
 # --- Configuration ---
 ctk.set_appearance_mode("Dark")
@@ -37,11 +40,22 @@ class RoundRobinScheduler(ctk.CTk):
         self.processes_data = []
         self.metrics_data = {}
         self.process_color_map = {} 
+        self.mc_executor = None
+        self.mc_cancel = None
+        self.mc_futures = []
+        self.mc_runs = []
+        self.mc_pending = None
 
         # --- Layouts ---
         self.create_sidebar()
         self.create_main_content()
 
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
+    def on_close(self):
+        self.cancel_monte_carlo()
+        self.destroy()
+
     # --- SIMULATION CONTROLS ---
     def rewind_animation(self):
         self.pause_animation()
@@ -357,9 +371,47 @@ class RoundRobinScheduler(ctk.CTk):
     def build_results_tab(self):
         self.results_metrics_frame = ctk.CTkFrame(self.tab_results, height=100, fg_color="transparent")
         self.results_metrics_frame.pack(fill="x", padx=10, pady=10)
+        self.build_monte_carlo_panel()
         self.results_plot_frame = ctk.CTkFrame(self.tab_results, fg_color="transparent")
         self.results_plot_frame.pack(fill="both", expand=True, padx=10, pady=10)
 
+    def build_monte_carlo_panel(self):
+        mc_frame = ctk.CTkFrame(self.tab_results, fg_color=("gray90", "gray20"))
+        mc_frame.pack(side="bottom", fill="x", padx=10, pady=10)
+
+        ctk.CTkLabel(mc_frame, text="MONTE CARLO CAPACITY PLANNING (95% Confidence Intervals)", 
+                     font=("Arial", 12, "bold"), anchor="w").pack(fill="x", padx=10, pady=(10, 5))
+
+        ctrl_frame = ctk.CTkFrame(mc_frame, fg_color="transparent")
+        ctrl_frame.pack(fill="x", padx=10)
+
+        self.mc_inputs = {}
+        for key, label, default, width in [
+            ("workloads", "Workloads", "2000", 60),
+            ("processes", "Processes", "8", 40),
+            ("rate", "Arrival Rate (λ)", "0.5", 50),
+            ("mean_bt", "Mean Burst", "5", 40),
+            ("quanta", "Quanta", "1,2,4,8", 80),
+            ("seed", "Seed", "42", 50),
+        ]:
+            ctk.CTkLabel(ctrl_frame, text=f"{label}:", font=("Arial", 11)).pack(side="left", padx=(5, 2))
+            entry = ctk.CTkEntry(ctrl_frame, width=width, justify="center")
+            entry.insert(0, default)
+            entry.pack(side="left", padx=(0, 5))
+            self.mc_inputs[key] = entry
+
+        self.mc_dist_menu = ctk.CTkOptionMenu(ctrl_frame, values=BURST_DISTRIBUTIONS, width=110)
+        self.mc_dist_menu.set(BURST_DISTRIBUTIONS[0])
+        self.mc_dist_menu.pack(side="left", padx=5)
+
+        self.btn_mc = ctk.CTkButton(ctrl_frame, text="🎲 Run Batch", width=110, fg_color="#e67e22", command=self.toggle_monte_carlo)
+        self.btn_mc.pack(side="right", padx=5)
+
+        self.mc_results_box = ctk.CTkTextbox(mc_frame, height=140, font=("Consolas", 12), wrap="none")
+        self.mc_results_box.pack(fill="x", padx=10, pady=10)
+        self.mc_results_box.insert("0.0", "No batch runs yet. Configure the distributions above and press 'Run Batch'.")
+        self.mc_results_box.configure(state="disabled")
+
     # --- LOGIC ENGINE ---
     def run_scheduler(self):
         processes = []
@@ -386,102 +438,8 @@ class RoundRobinScheduler(ctk.CTk):
             self.show_error("Add at least one process!")
             return
 
-        # SETUP
-        processes.sort(key=lambda x: x['at'])
-        current_time = 0
-        ready_queue = deque()
-        gantt = []
-        visited_indices = set()
-        self.event_log = {}
-        self.queue_history = {}
-        
-        def get_arrivals(t):
-            arrived = []
-            for i, p in enumerate(processes):
-                if i not in visited_indices and p['at'] <= t:
-                    visited_indices.add(i)
-                    arrived.append(i)
-            return arrived
-
-        initial_arrivals = get_arrivals(0)
-        for idx in initial_arrivals:
-            ready_queue.append(idx)
-        
-        metrics = {p['id']: {'ct':0, 'tat':0, 'wt':0} for p in processes}
-        completed_count = 0
-        n = len(processes)
-        active_p_idx = None
-        quantum_timer = 0
-        
-        while completed_count < n:
-            daily_log = []
-            daily_log.append(f"--- Second {current_time} to {current_time+1} ---")
-            
-            self.queue_history[current_time] = [processes[i]['id'] for i in ready_queue]
-            
-            if active_p_idx is None:
-                if ready_queue:
-                    active_p_idx = ready_queue.popleft()
-                    quantum_timer = 0
-                    p_curr = processes[active_p_idx]
-                    daily_log.append(f"⚡ ACTION: {p_curr['id']} has been loaded into the CPU.")
-                else:
-                    gantt.append({"id": "IDLE", "start": current_time, "end": current_time + 1})
-                    daily_log.append("💤 STATUS: The CPU is idle. No processes are ready yet.")
-                    
-                    current_time += 1
-                    
-                    new_guys = get_arrivals(current_time)
-                    if new_guys:
-                        names = [processes[i]['id'] for i in new_guys]
-                        daily_log.append(f"📢 NEW ARRIVAL: {', '.join(names)} just arrived and joined the waiting line.")
-                        for i in new_guys: ready_queue.append(i)
-
-                    self.event_log[current_time-1] = daily_log
-                    continue
-
-            p = processes[active_p_idx]
-            
-            if gantt and gantt[-1]['id'] == p['id'] and gantt[-1]['end'] == current_time:
-                gantt[-1]['end'] += 1
-            else:
-                gantt.append({"id": p['id'], "start": current_time, "end": current_time + 1})
-
-            p['rem_bt'] -= 1
-            quantum_timer += 1
-            
-            status_msg = f"⚙️ WORKING: {p['id']} is running."
-            status_msg += f" It has {p['rem_bt']}s work left."
-            status_msg += f" (Slice used: {quantum_timer}/{tq}s)"
-            daily_log.append(status_msg)
-            
-            current_time += 1
-            
-            new_guys = get_arrivals(current_time)
-            if new_guys:
-                names = [processes[i]['id'] for i in new_guys]
-                daily_log.append(f"📢 NEW ARRIVAL: {', '.join(names)} arrived and joined the line.")
-                for i in new_guys: ready_queue.append(i)
-            
-            if p['rem_bt'] == 0:
-                completed_count += 1
-                metrics[p['id']]['ct'] = current_time
-                metrics[p['id']]['tat'] = current_time - p['at']
-                metrics[p['id']]['wt'] = metrics[p['id']]['tat'] - p['orig_bt']
-                daily_log.append(f"✅ FINISHED: {p['id']} has completed all its work! It leaves the system.")
-                active_p_idx = None
-            elif quantum_timer == tq:
-                ready_queue.append(active_p_idx)
-                daily_log.append(f"⚖️ TIME'S UP: {p['id']} used its full time slice ({tq}s). Moving it to back of line to be fair.")
-                active_p_idx = None
-            
-            self.event_log[current_time-1] = daily_log
-
-        self.queue_history[current_time] = []
-        self.event_log[current_time] = ["🏁 SIMULATION COMPLETE: All processes have finished execution."]
+        self.gantt_log, self.metrics_data, self.event_log, self.queue_history, current_time = run_round_robin(processes, tq)
         self.total_ticks = current_time
-        self.gantt_log = gantt
-        self.metrics_data = metrics
         self.processes_data = processes
 
         self.tabview.set("2. Live Simulation")
@@ -492,6 +450,101 @@ class RoundRobinScheduler(ctk.CTk):
     def show_error(self, msg):
         mb.showerror("Error", msg)
 
+    # --- MONTE CARLO BATCH ---
+    def toggle_monte_carlo(self):
+        if self.mc_futures:
+            self.cancel_monte_carlo()
+        else:
+            self.start_monte_carlo()
+
+    def start_monte_carlo(self):
+        if self.mc_futures: return
+
+        try:
+            n_workloads = int(self.mc_inputs["workloads"].get())
+            n_processes = int(self.mc_inputs["processes"].get())
+            rate = float(self.mc_inputs["rate"].get())
+            mean_bt = float(self.mc_inputs["mean_bt"].get())
+            quanta = sorted({int(q) for q in self.mc_inputs["quanta"].get().split(",") if q.strip()})
+            seed = int(self.mc_inputs["seed"].get())
+            if n_workloads <= 0 or n_processes <= 0 or rate <= 0 or mean_bt <= 0: raise ValueError
+            if not (math.isfinite(rate) and math.isfinite(mean_bt)): raise ValueError
+            if not quanta or quanta[0] <= 0: raise ValueError
+        except ValueError:
+            self.show_error("Monte Carlo inputs must be positive numbers (quanta as a comma separated list).")
+            return
+
+        if n_workloads * n_processes > MC_MAX_SAMPLES:
+            self.show_error(f"Workloads × Processes must not exceed {MC_MAX_SAMPLES:,}.")
+            return
+
+        dist = self.mc_dist_menu.get()
+        try:
+            arrivals, bursts = generate_workloads(n_workloads, n_processes, rate, dist, mean_bt, seed)
+        except ValueError as e:
+            self.show_error(str(e))
+            return
+        except MemoryError:
+            self.show_error("Not enough memory to generate this many workloads.")
+            return
+
+        self.mc_pending = {"label": f"#{len(self.mc_runs) + 1} {dist} λ={rate:g} μ={mean_bt:g} seed={seed}",
+                           "n": n_workloads, "quanta": quanta}
+        self.mc_cancel = multiprocessing.Event()
+        self.mc_executor = create_executor(self.mc_cancel)
+        self.mc_futures = submit_monte_carlo(self.mc_executor, arrivals, bursts, quanta)
+        self.btn_mc.configure(text="✖ Cancel", fg_color="#c0392b")
+        self.after(100, self.poll_monte_carlo)
+
+    def cancel_monte_carlo(self):
+        if self.mc_executor is None: return
+
+        # Drop queued chunks; chunks already running see the event and return after their current workload
+        self.mc_cancel.set()
+        self.mc_executor.shutdown(wait=False, cancel_futures=True)
+
+        self.mc_executor = None
+        self.mc_cancel = None
+        self.mc_futures = []
+        self.mc_pending = None
+        self.btn_mc.configure(text="🎲 Run Batch", fg_color="#e67e22")
+
+    def poll_monte_carlo(self):
+        if not self.mc_futures: return
+        if not all(f.done() for f in self.mc_futures):
+            self.after(100, self.poll_monte_carlo)
+            return
+
+        try:
+            batches = [f.result() for f in self.mc_futures]
+            self.mc_runs.append({**self.mc_pending, "summary": summarize_monte_carlo(batches, self.mc_pending["quanta"])})
+        except Exception as e:
+            self.show_error(f"Monte Carlo batch failed: {e}")
+        finally:
+            self.mc_executor.shutdown()
+            self.mc_executor = None
+            self.mc_cancel = None
+            self.mc_futures = []
+            self.mc_pending = None
+            self.btn_mc.configure(text="🎲 Run Batch", fg_color="#e67e22")
+
+        self.update_monte_carlo_results()
+
+    def update_monte_carlo_results(self):
+        lines = []
+        for run in reversed(self.mc_runs):
+            lines.append(f"Run {run['label']}  ({run['n']} workloads)")
+            lines.append(f"  {'Quantum':>8}  {'Avg Turnaround':>20}  {'Avg Waiting':>20}")
+            for tq, stats in run["summary"].items():
+                tat, wt = stats["tat"], stats["wt"]
+                lines.append(f"  {tq:>8}  {f'{tat[0]:.2f} ± {tat[1]:.2f}s':>20}  {f'{wt[0]:.2f} ± {wt[1]:.2f}s':>20}")
+            lines.append("")
+
+        self.mc_results_box.configure(state="normal")
+        self.mc_results_box.delete("0.0", "end")
+        self.mc_results_box.insert("0.0", "\n".join(lines))
+        self.mc_results_box.configure(state="disabled")
+
     # --- ANIMATION ---
     def reset_animation(self):
         self.pause_animation()
@@ -0,0 +1,210 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import os
+import numpy as np
+
+# --- Scheduling Engine ---
+# Per-tick Round Robin used by the live simulation. Sorts `processes` in place and consumes 'rem_bt'.
+def run_round_robin(processes, tq):
+    # SETUP
+    processes.sort(key=lambda x: x['at'])
+    current_time = 0
+    ready_queue = deque()
+    gantt = []
+    visited_indices = set()
+    event_log = {}
+    queue_history = {}
+
+    def get_arrivals(t):
+        arrived = []
+        for i, p in enumerate(processes):
+            if i not in visited_indices and p['at'] <= t:
+                visited_indices.add(i)
+                arrived.append(i)
+        return arrived
+
+    initial_arrivals = get_arrivals(0)
+    for idx in initial_arrivals:
+        ready_queue.append(idx)
+
+    metrics = {p['id']: {'ct':0, 'tat':0, 'wt':0} for p in processes}
+    completed_count = 0
+    n = len(processes)
+    active_p_idx = None
+    quantum_timer = 0
+
+    while completed_count < n:
+        daily_log = []
+        daily_log.append(f"--- Second {current_time} to {current_time+1} ---")
+
+        queue_history[current_time] = [processes[i]['id'] for i in ready_queue]
+
+        if active_p_idx is None:
+            if ready_queue:
+                active_p_idx = ready_queue.popleft()
+                quantum_timer = 0
+                p_curr = processes[active_p_idx]
+                daily_log.append(f"⚡ ACTION: {p_curr['id']} has been loaded into the CPU.")
+            else:
+                gantt.append({"id": "IDLE", "start": current_time, "end": current_time + 1})
+                daily_log.append("💤 STATUS: The CPU is idle. No processes are ready yet.")
+
+                current_time += 1
+
+                new_guys = get_arrivals(current_time)
+                if new_guys:
+                    names = [processes[i]['id'] for i in new_guys]
+                    daily_log.append(f"📢 NEW ARRIVAL: {', '.join(names)} just arrived and joined the waiting line.")
+                    for i in new_guys: ready_queue.append(i)
+
+                event_log[current_time-1] = daily_log
+                continue
+
+        p = processes[active_p_idx]
+
+        if gantt and gantt[-1]['id'] == p['id'] and gantt[-1]['end'] == current_time:
+            gantt[-1]['end'] += 1
+        else:
+            gantt.append({"id": p['id'], "start": current_time, "end": current_time + 1})
+
+        p['rem_bt'] -= 1
+        quantum_timer += 1
+
+        status_msg = f"⚙️ WORKING: {p['id']} is running."
+        status_msg += f" It has {p['rem_bt']}s work left."
+        status_msg += f" (Slice used: {quantum_timer}/{tq}s)"
+        daily_log.append(status_msg)
+
+        current_time += 1
+
+        new_guys = get_arrivals(current_time)
+        if new_guys:
+            names = [processes[i]['id'] for i in new_guys]
+            daily_log.append(f"📢 NEW ARRIVAL: {', '.join(names)} arrived and joined the line.")
+            for i in new_guys: ready_queue.append(i)
+
+        if p['rem_bt'] == 0:
+            completed_count += 1
+            metrics[p['id']]['ct'] = current_time
+            metrics[p['id']]['tat'] = current_time - p['at']
+            metrics[p['id']]['wt'] = metrics[p['id']]['tat'] - p['orig_bt']
+            daily_log.append(f"✅ FINISHED: {p['id']} has completed all its work! It leaves the system.")
+            active_p_idx = None
+        elif quantum_timer == tq:
+            ready_queue.append(active_p_idx)
+            daily_log.append(f"⚖️ TIME'S UP: {p['id']} used its full time slice ({tq}s). Moving it to back of line to be fair.")
+            active_p_idx = None
+
+        event_log[current_time-1] = daily_log
+
+    queue_history[current_time] = []
+    event_log[current_time] = ["🏁 SIMULATION COMPLETE: All processes have finished execution."]
+    return gantt, metrics, event_log, queue_history, current_time
+
+BURST_DISTRIBUTIONS = ["Exponential", "Lognormal", "Bimodal"]
+LOGNORMAL_SIGMA = 0.75
+BIMODAL_LONG_FRACTION = 0.2    # share of long CPU-bound jobs
+BIMODAL_SHORT_SCALE = 0.5      # short/long component centres, relative to each other
+BIMODAL_LONG_SCALE = 3.0
+BIMODAL_SPREAD = 0.15          # std of each component as a fraction of its centre
+MC_MAX_SAMPLES = 5_000_000     # cap on n_workloads * n_processes held in memory
+
+# --- Monte Carlo Engine ---
+# Workloads live in (n_workloads, n_processes) NumPy arrays and never touch the per-row widgets.
+def generate_workloads(n_workloads, n_processes, arrival_rate, burst_dist, mean_burst, seed):
+    rng = np.random.default_rng(seed)
+    size = (n_workloads, n_processes)
+
+    # Poisson arrivals: exponential inter-arrival gaps, accumulated and floored to whole seconds
+    arrivals = np.floor(np.cumsum(rng.exponential(1.0 / arrival_rate, size), axis=1))
+
+    if burst_dist == "Exponential":
+        bursts = rng.exponential(mean_burst, size)
+    elif burst_dist == "Lognormal":
+        sigma = LOGNORMAL_SIGMA
+        bursts = rng.lognormal(np.log(mean_burst) - sigma**2 / 2, sigma, size)
+    elif burst_dist == "Bimodal":
+        # Short interactive jobs mixed with long CPU-bound ones; centres are rescaled so the mixture mean is mean_burst
+        p = BIMODAL_LONG_FRACTION
+        unit = mean_burst / ((1 - p) * BIMODAL_SHORT_SCALE + p * BIMODAL_LONG_SCALE)
+        centres = np.where(rng.random(size) < p, BIMODAL_LONG_SCALE * unit, BIMODAL_SHORT_SCALE * unit)
+        bursts = rng.normal(centres, BIMODAL_SPREAD * centres)
+    else:
+        raise ValueError(f"Unknown burst distribution: {burst_dist}")
+
+    # Rounding to whole seconds (minimum 1) makes the realised mean only approximately mean_burst
+    bursts = np.maximum(1, np.rint(bursts))
+
+    # Anything past int64 would wrap to INT64_MIN on the cast below instead of failing
+    if not (arrivals.max() < 2.0**63 and bursts.max() < 2.0**63):
+        raise ValueError("Arrival Rate / Mean Burst produce times too large to simulate.")
+
+    return arrivals.astype(np.int64), bursts.astype(np.int64)
+
+def simulate_round_robin(arrivals, bursts, tq):
+    # Event-driven twin of run_round_robin: same queue rules (arrivals join BEFORE timeouts), no logging.
+    # Expects arrivals sorted ascending. Returns (avg_tat, avg_wt).
+    n = len(arrivals)
+    rem = list(bursts)
+    ready = deque()
+    nxt, t, done, total_tat = 0, 0, 0, 0
+
+    while nxt < n and arrivals[nxt] <= t:
+        ready.append(nxt); nxt += 1
+
+    while done < n:
+        if not ready:
+            t = arrivals[nxt]
+            while nxt < n and arrivals[nxt] <= t:
+                ready.append(nxt); nxt += 1
+            continue
+
+        i = ready.popleft()
+        run = min(tq, rem[i])
+        t += run
+        rem[i] -= run
+
+        while nxt < n and arrivals[nxt] <= t:
+            ready.append(nxt); nxt += 1
+
+        if rem[i] == 0:
+            done += 1
+            total_tat += t - arrivals[i]
+        else:
+            ready.append(i)
+
+    avg_tat = total_tat / n
+    return avg_tat, avg_tat - sum(bursts) / n
+
+_cancel_event = None
+
+def _init_worker(cancel_event):
+    # Runs once per worker process; the event is inherited, so cancelling never needs to kill a worker
+    global _cancel_event
+    _cancel_event = cancel_event
+
+def _simulate_batch(arrivals, bursts, quanta):
+    # Worker entry point. Result shape: (len(quanta), n_workloads, 2) -> [avg_tat, avg_wt]
+    out = np.empty((len(quanta), len(arrivals), 2))
+    for w, (at, bt) in enumerate(zip(arrivals.tolist(), bursts.tolist())):
+        if _cancel_event is not None and _cancel_event.is_set(): return None
+        for q, tq in enumerate(quanta):
+            out[q, w] = simulate_round_robin(at, bt, tq)
+    return out
+
+def create_executor(cancel_event):
+    return ProcessPoolExecutor(initializer=_init_worker, initargs=(cancel_event,))
+
+def submit_monte_carlo(executor, arrivals, bursts, quanta):
+    n_chunks = max(1, min(len(arrivals), (os.cpu_count() or 1) * 4))
+    return [executor.submit(_simulate_batch, a, b, quanta)
+            for a, b in zip(np.array_split(arrivals, n_chunks), np.array_split(bursts, n_chunks))]
+
+def summarize_monte_carlo(batches, quanta, z=1.96):
+    # Normal-approximation confidence interval: mean ± z * std / sqrt(n)
+    results = np.concatenate(batches, axis=1)
+    n = results.shape[1]
+    means = results.mean(axis=1)
+    half_widths = z * results.std(axis=1, ddof=1) / np.sqrt(n) if n > 1 else np.zeros_like(means)
+    return {tq: {"tat": (means[q, 0], half_widths[q, 0]), "wt": (means[q, 1], half_widths[q, 1])}
+            for q, tq in enumerate(quanta)}
@@ -0,0 +1,56 @@
+import random
+
+import numpy as np
+import pytest
+
+from scheduler_engine import (BURST_DISTRIBUTIONS, run_round_robin, generate_workloads,
+                              simulate_round_robin, _simulate_batch, summarize_monte_carlo)
+
+
+def tick_averages(arrivals, bursts, tq):
+    processes = [{'id': f"P{i+1}", 'at': at, 'bt': bt, 'rem_bt': bt, 'orig_bt': bt}
+                 for i, (at, bt) in enumerate(zip(arrivals, bursts))]
+    _, metrics, _, _, _ = run_round_robin(processes, tq)
+    n = len(metrics)
+    return sum(m['tat'] for m in metrics.values()) / n, sum(m['wt'] for m in metrics.values()) / n
+
+
+def test_simulate_round_robin_matches_live_scheduler():
+    rng = random.Random(0)
+    for _ in range(2000):
+        n = rng.randint(1, 8)
+        arrivals = sorted(rng.randint(0, 15) for _ in range(n))
+        bursts = [rng.randint(1, 10) for _ in range(n)]
+        tq = rng.randint(1, 5)
+        assert simulate_round_robin(arrivals, bursts, tq) == pytest.approx(tick_averages(arrivals, bursts, tq)), (arrivals, bursts, tq)
+
+
+def test_generated_workloads_match_live_scheduler():
+    for dist in BURST_DISTRIBUTIONS:
+        arrivals, bursts = generate_workloads(50, 6, 0.5, dist, 4, seed=7)
+        for at, bt in zip(arrivals.tolist(), bursts.tolist()):
+            assert simulate_round_robin(at, bt, 2) == pytest.approx(tick_averages(at, bt, 2))
+
+
+def test_fixed_seed_is_reproducible():
+    first = generate_workloads(100, 5, 0.5, "Lognormal", 5, seed=42)
+    second = generate_workloads(100, 5, 0.5, "Lognormal", 5, seed=42)
+    assert all(np.array_equal(a, b) for a, b in zip(first, second))
+
+    quanta = [1, 4]
+    assert summarize_monte_carlo([_simulate_batch(*first, quanta)], quanta) == \
+           summarize_monte_carlo([_simulate_batch(*second, quanta)], quanta)
+
+
+def test_summarize_monte_carlo_shape():
+    arrivals, bursts = generate_workloads(40, 4, 0.5, "Exponential", 5, seed=1)
+    quanta = [1, 2, 8]
+    batches = [_simulate_batch(a, b, quanta) for a, b in zip(np.array_split(arrivals, 3), np.array_split(bursts, 3))]
+    assert all(batch.shape[0] == len(quanta) and batch.shape[2] == 2 for batch in batches)
+
+    summary = summarize_monte_carlo(batches, quanta)
+    assert list(summary) == quanta
+    for stats in summary.values():
+        assert set(stats) == {"tat", "wt"}
+        for mean, half_width in stats.values():
+            assert np.isfinite(mean) and half_width >= 0